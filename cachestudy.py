@@ -3,16 +3,20 @@ import salabim as sim
 class Request(sim.Component):
     def process(self):
         self.request(database)
-        self.hold(sim.Uniform(0, 100).sample())
+        self.hold(service_time.sample())
         self.release()
 
 class RequestGenerator(sim.Component):
     def process(self):
+        hold = self.hold
+        sample = inter_arrival_time.sample
         while True:
             Request()
-            self.hold(sim.Uniform(0, 100).sample())
+            hold(sample())
 
 env = sim.Environment()
+inter_arrival_time = sim.Uniform(0, 100)
+service_time = sim.Uniform(0, 100)
 RequestGenerator()
 database = sim.Resource("database", capacity=1)
 env.run(till=50000)